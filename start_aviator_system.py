@@ -14,24 +14,40 @@ Versión: 19.3
 Fecha: 2025-01-24
 """
 
-import subprocess
+import asyncio
+import importlib.util
 import time
 import sys
 import os
 import signal
-import webbrowser
-import requests
+import socket
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 import logging
-from datetime import datetime
+import logging.handlers
+
+# aiohttp, webbrowser y datetime se importan solo donde se usan, fuera de las
+# verificaciones previas: un fallo de dependencias o scripts aborta sin cargarlos
+if TYPE_CHECKING:
+    import aiohttp
 
 # Configuración de logging
+# El fichero se escribe por lotes: los registros se acumulan en memoria y se
+# vuelcan al llegar a WARNING, al llenarse el buffer o al cerrar el launcher
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_log_file = logging.FileHandler('aviator_system.log')
+_log_file.setFormatter(logging.Formatter(LOG_FORMAT))
+file_log_handler = logging.handlers.MemoryHandler(
+    capacity=512,
+    flushLevel=logging.WARNING,
+    target=_log_file
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('aviator_system.log'),
+        file_log_handler,
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -40,49 +56,149 @@ logger = logging.getLogger(__name__)
 # Configuración de servicios
 SERVICES_CONFIG = {
     "realtime_detector": {
+        "kind": "fastapi",
         "script": "microservicios/realtime_detector/main.py",
         "port": 8002,
         "health_endpoint": "/health",
         "description": "Detector en Tiempo Real"
     },
     "aviator_patterns_engine": {
+        "kind": "fastapi",
         "script": "microservicios/aviator_patterns_engine/main.py", 
-        "port": 8002,
+        "port": 8003,
         "health_endpoint": "/health",
         "description": "Motor de Patrones Aviator"
     },
     "main_dashboard": {
+        "kind": "streamlit",
         "script": "dashboards/main_dashboard.py",
         "port": 8501,
         "health_endpoint": "/health",
-        "description": "Dashboard Principal"
+        "description": "Dashboard Principal",
+        "depends_on": ["realtime_detector", "aviator_patterns_engine"]
     },
     "integrated_dashboard": {
+        "kind": "streamlit",
         "script": "dashboards/integrated_dashboard.py",
         "port": 8502,
         "health_endpoint": "/health",
-        "description": "Dashboard Integrado"
+        "description": "Dashboard Integrado",
+        "depends_on": ["realtime_detector", "aviator_patterns_engine"]
     }
 }
 
+def _validate_services_config(config: Dict[str, Dict]):
+    """Detectar al cargar el módulo errores de configuración que harían fallar el arranque."""
+    ports: Dict[int, str] = {}
+    for name, service in config.items():
+        port = service["port"]
+        if port in ports:
+            raise ValueError(f"Puerto {port} duplicado en SERVICES_CONFIG: {ports[port]} y {name}")
+        ports[port] = name
+        
+        unknown = [dep for dep in service.get("depends_on", []) if dep not in config]
+        if unknown:
+            raise ValueError(f"Dependencias desconocidas para {name}: {', '.join(unknown)}")
+    
+    # Un ciclo en depends_on dejaría a los servicios esperándose entre sí para siempre
+    visited: Set[str] = set()
+    path: List[str] = []
+    
+    def visit(name: str):
+        if name in path:
+            cycle = path[path.index(name):] + [name]
+            raise ValueError(f"Dependencia cíclica en SERVICES_CONFIG: {' -> '.join(cycle)}")
+        if name in visited:
+            return
+        path.append(name)
+        for dep in config[name].get("depends_on", []):
+            visit(dep)
+        path.pop()
+        visited.add(name)
+    
+    for name in config:
+        visit(name)
+
+_validate_services_config(SERVICES_CONFIG)
+
+# Líneas que indican que cada tipo de servicio ha terminado de arrancar
+UVICORN_READY_MARKER = b"Uvicorn running on"
+STREAMLIT_READY_MARKER = b"You can now view your Streamlit app"
+READY_TIMEOUT = 5
+READY_POLL_INTERVAL = 0.1
+
+# Tamaño máximo del pool de conexiones HTTP para las verificaciones de salud
+HTTP_POOL_MAXSIZE = 16
+
+# Reinicio automático de servicios caídos (segundos)
+RESTART_BACKOFF_INITIAL = 1
+RESTART_BACKOFF_MAX = 30
+RESTART_STABLE_AFTER = 60
+
+# Directorio con la salida (stdout/stderr) de cada servicio
+LOGS_DIR = Path("logs")
+
+READY_MARKERS = {
+    "fastapi": UVICORN_READY_MARKER,
+    "streamlit": STREAMLIT_READY_MARKER,
+}
+
+def _env_flag(name: str) -> bool:
+    """Leer una variable de entorno booleana ("1", "true", "yes", "on")."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+def _build_cmd(config: Dict) -> Tuple[str, ...]:
+    """Construir el comando de arranque de un servicio según su tipo."""
+    script_path = config["script"]
+    port = config["port"]
+    kind = config.get("kind")
+    
+    if kind == "streamlit":
+        return (
+            sys.executable, "-m", "streamlit", "run", 
+            script_path, 
+            "--server.port", str(port),
+            "--server.headless", "true",
+            "--browser.gatherUsageStats", "false"
+        )
+    if kind == "fastapi":
+        # --reload añade un proceso supervisor que vigila el árbol de ficheros:
+        # solo se activa en desarrollo (AVIATOR_DEV=1)
+        reload_flag = ("--reload",) if _env_flag("AVIATOR_DEV") else ()
+        return (
+            sys.executable, "-m", "uvicorn",
+            f"{Path(script_path).with_suffix('').as_posix().replace('/', '.')}:app",
+            "--host", "0.0.0.0",
+            "--port", str(port),
+            *reload_flag
+        )
+    return (sys.executable, script_path)
+
+# Los comandos no cambian durante la ejecución: se construyen una sola vez
+# como tuplas inmutables y se reutilizan en cada arranque o reinicio
+for _index, _config in enumerate(SERVICES_CONFIG.values()):
+    _config["cmd"] = _build_cmd(_config)
+    _config["ready_marker"] = READY_MARKERS.get(_config.get("kind"))
+    _config["cpu_index"] = _index
+
 # Variables globales para gestión de procesos
-running_processes: Dict[str, subprocess.Popen] = {}
+running_processes: Dict[str, asyncio.subprocess.Process] = {}
+watcher_tasks: Dict[str, asyncio.Task] = {}
 shutdown_requested = False
 
 def check_dependencies() -> bool:
     """Verificar que todas las dependencias estén instaladas."""
-    required_packages = ['streamlit', 'fastapi', 'uvicorn', 'requests']
+    required_packages = ['streamlit', 'fastapi', 'uvicorn', 'aiohttp']
     
     logger.info("🔍 Verificando dependencias del sistema...")
     
     for package in required_packages:
-        try:
-            __import__(package)
-            logger.info(f"✅ {package}: OK")
-        except ImportError:
+        # find_spec localiza el módulo sin ejecutarlo (evita importar streamlit entero)
+        if importlib.util.find_spec(package) is None:
             logger.error(f"❌ {package}: NO ENCONTRADO")
             logger.error(f"Instala con: pip install {package}")
             return False
+        logger.info(f"✅ {package}: OK")
     
     logger.info("✅ Todas las dependencias están instaladas")
     return True
@@ -91,75 +207,181 @@ def check_scripts_exist() -> bool:
     """Verificar que todos los scripts del sistema existan."""
     logger.info("📁 Verificando existencia de scripts del sistema...")
     
-    for service_name, config in SERVICES_CONFIG.items():
+    # Agrupar los scripts por directorio para leer cada uno una sola vez
+    by_parent: Dict[Path, Set[str]] = defaultdict(set)
+    for config in SERVICES_CONFIG.values():
         script_path = Path(config["script"])
-        if script_path.exists():
+        by_parent[script_path.parent].add(script_path.name)
+    
+    present: Set[Path] = set()
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                present.update(parent / entry.name for entry in entries
+                               if entry.name in names and entry.is_file())
+        except OSError:
+            # Directorio inexistente o ilegible: todos sus scripts faltan
+            pass
+    
+    missing = False
+    for config in SERVICES_CONFIG.values():
+        script_path = Path(config["script"])
+        if script_path in present:
             logger.info(f"✅ {config['description']}: {script_path}")
         else:
             logger.error(f"❌ {config['description']}: {script_path} NO ENCONTRADO")
-            return False
+            missing = True
+    
+    if missing:
+        return False
     
     logger.info("✅ Todos los scripts del sistema están presentes")
     return True
 
-def start_service(service_name: str, config: Dict) -> Optional[subprocess.Popen]:
+async def wait_for_ready_line(process: asyncio.subprocess.Process, log_path: Path, offset: int,
+                              marker: Optional[bytes], timeout: float = READY_TIMEOUT) -> bytes:
+    """Leer el log del proceso hasta ver la línea de arranque, su fin o el timeout.
+    
+    Devuelve la salida leída para poder mostrarla si el proceso falla.
+    """
+    if marker is None:
+        # Sin línea conocida: solo detectar una salida inmediata
+        timeout = 2
+    
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    exit_task = asyncio.ensure_future(process.wait())
+    output = b""
+    
+    try:
+        with open(log_path, "rb") as log_file:
+            log_file.seek(offset)
+            while True:
+                output += log_file.read()
+                if marker is not None and marker in output:
+                    break
+                if exit_task.done():
+                    # El proceso ha terminado: recoger lo último que escribió
+                    output += log_file.read()
+                    break
+                
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    # Arranque lento: la verificación de salud decidirá
+                    break
+                await asyncio.wait({exit_task}, timeout=min(remaining, READY_POLL_INTERVAL))
+    finally:
+        if not exit_task.done():
+            exit_task.cancel()
+    
+    return output
+
+def is_port_in_use(port: int) -> bool:
+    """Comprobar si el puerto ya está ocupado antes de lanzar el servicio."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # Igual que Uvicorn: ignorar conexiones en TIME_WAIT
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("0.0.0.0", port))
+        except OSError:
+            return True
+    return False
+
+def pin_to_cpu(process: asyncio.subprocess.Process, config: Dict):
+    """Fijar el proceso a un núcleo propio (solo Linux y con AVIATOR_PIN_CPUS=1)."""
+    if not _env_flag("AVIATOR_PIN_CPUS") or not hasattr(os, "sched_setaffinity"):
+        return
+    
+    # Usar los núcleos realmente disponibles (respeta el cpuset del contenedor)
+    cpus = sorted(os.sched_getaffinity(0))
+    cpu = cpus[config["cpu_index"] % len(cpus)]
+    try:
+        os.sched_setaffinity(process.pid, {cpu})
+        logger.info(f"📌 {config['description']} fijado al núcleo {cpu}")
+    except OSError as e:
+        logger.warning(f"⚠️ No se pudo fijar {config['description']} al núcleo {cpu}: {e}")
+
+async def start_service(service_name: str, config: Dict) -> Optional[asyncio.subprocess.Process]:
     """Iniciar un servicio específico."""
-    script_path = config["script"]
-    port = config["port"]
     description = config["description"]
+    log_path = LOGS_DIR / f"{service_name}.log"
     
     logger.info(f"🚀 Iniciando {description}...")
     
     try:
-        # Determinar el comando según el tipo de script
-        if "streamlit" in script_path or script_path.endswith(".py") and "dashboard" in script_path:
-            cmd = [
-                sys.executable, "-m", "streamlit", "run", 
-                script_path, 
-                "--server.port", str(port),
-                "--server.headless", "true",
-                "--browser.gatherUsageStats", "false"
-            ]
-        elif "fastapi" in script_path or "main.py" in script_path:
-            cmd = [
-                sys.executable, "-m", "uvicorn",
-                f"{script_path.replace('/', '.').replace('.py', '')}:app",
-                "--host", "0.0.0.0",
-                "--port", str(port),
-                "--reload"
-            ]
-        else:
-            cmd = [sys.executable, script_path]
+        # Fallar de inmediato en vez de esperar al timeout de la verificación de salud
+        if is_port_in_use(config["port"]):
+            logger.error(f"❌ {description}: el puerto {config['port']} ya está en uso")
+            return None
         
-        # Iniciar el proceso
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
-        )
+        # La salida del servicio va directamente a su fichero de log: con un PIPE
+        # que nadie lee, el hijo se bloquearía al llenarse el buffer (64KB).
+        # stderr se une a stdout porque Uvicorn escribe sus logs en stderr.
+        LOGS_DIR.mkdir(exist_ok=True)
+        with open(log_path, "ab", buffering=0) as log_file:
+            offset = log_file.tell()
+            # close_fds=False (sin preexec_fn ni cwd) permite a subprocess usar
+            # os.posix_spawn en lugar de fork()+exec(). Es seguro porque los
+            # descriptores que abre Python no son heredables (PEP 446).
+            process = await asyncio.create_subprocess_exec(
+                *config["cmd"],
+                stdout=log_file,
+                stderr=asyncio.subprocess.STDOUT,
+                close_fds=False
+            )
+        pin_to_cpu(process, config)
         
-        # Esperar un momento para verificar que el proceso se inició correctamente
-        time.sleep(2)
+        # Esperar la línea de arranque del servicio en lugar de una pausa fija
+        try:
+            output = await wait_for_ready_line(process, log_path, offset, config["ready_marker"])
+        except asyncio.CancelledError:
+            # Cierre durante el arranque: no dejar el proceso huérfano
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            raise
         
-        if process.poll() is None:
+        if process.returncode is None:
             logger.info(f"✅ {description} iniciado correctamente (PID: {process.pid})")
             return process
         else:
-            stdout, stderr = process.communicate()
             logger.error(f"❌ Error al iniciar {description}:")
-            logger.error(f"STDOUT: {stdout}")
-            logger.error(f"STDERR: {stderr}")
+            logger.error(f"SALIDA ({log_path}): {output.decode(errors='replace')}")
             return None
             
     except Exception as e:
         logger.error(f"❌ Excepción al iniciar {description}: {e}")
         return None
 
-def check_service_health(service_name: str, config: Dict, timeout: int = 30) -> bool:
+async def start_with_dependencies(service_name: str, config: Dict,
+                                  ready_events: Dict[str, asyncio.Event]) -> Optional[asyncio.subprocess.Process]:
+    """Iniciar un servicio cuando sus dependencias hayan arrancado."""
+    dependencies = config.get("depends_on", [])
+    try:
+        if dependencies:
+            await asyncio.gather(*(ready_events[dep].wait() for dep in dependencies))
+        
+        failed = [dep for dep in dependencies if dep not in running_processes]
+        if failed:
+            # Se inicia igualmente: el dashboard puede funcionar con datos parciales
+            logger.warning(f"⚠️ {config['description']}: dependencias no disponibles ({', '.join(failed)})")
+        
+        process = await start_service(service_name, config)
+        if process:
+            running_processes[service_name] = process
+            logger.info(f"📊 {config['description']}: http://localhost:{config['port']}")
+        else:
+            logger.error(f"❌ No se pudo iniciar {config['description']}")
+        return process
+    finally:
+        # Desbloquear a los dependientes tanto si arrancó como si falló
+        ready_events[service_name].set()
+
+async def check_service_health(session: "aiohttp.ClientSession", service_name: str, config: Dict, timeout: int = 30) -> bool:
     """Verificar que un servicio esté respondiendo correctamente."""
+    import aiohttp
+    
     port = config["port"]
     health_endpoint = config["health_endpoint"]
     url = f"http://localhost:{port}{health_endpoint}"
@@ -169,49 +391,126 @@ def check_service_health(service_name: str, config: Dict, timeout: int = 30) ->
     start_time = time.time()
     while time.time() - start_time < timeout:
         try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                logger.info(f"✅ {config['description']}: ACTIVO")
-                return True
-        except requests.exceptions.RequestException:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status == 200:
+                    logger.info(f"✅ {config['description']}: ACTIVO")
+                    return True
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             pass
         
-        time.sleep(2)
+        # Sondeo no bloqueante: se puede reintentar con más frecuencia
+        await asyncio.sleep(0.5)
     
     logger.warning(f"⚠️ {config['description']}: No responde en {url}")
     return False
 
-def signal_handler(signum, frame):
+async def check_all_services_health() -> bool:
+    """Verificar en paralelo la salud de todos los servicios en ejecución."""
+    import aiohttp
+    
+    # Los sondeos se solapan: el servicio más lento marca el tiempo total
+    # Sesión compartida: las conexiones keep-alive se reutilizan entre sondeos
+    # y la resolución de "localhost" se cachea durante todo el arranque
+    connector = aiohttp.TCPConnector(limit=HTTP_POOL_MAXSIZE, ttl_dns_cache=None)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        health_results = await asyncio.gather(*(
+            check_service_health(session, service_name, config)
+            for service_name, config in SERVICES_CONFIG.items()
+            if service_name in running_processes
+        ))
+    return all(health_results)
+
+async def watch_service(service_name: str, process: asyncio.subprocess.Process):
+    """Vigilar un servicio y reiniciarlo con backoff exponencial si se detiene."""
+    config = SERVICES_CONFIG[service_name]
+    loop = asyncio.get_running_loop()
+    backoff = RESTART_BACKOFF_INITIAL
+    started_at = loop.time()
+    
+    while True:
+        # process.wait() se resuelve cuando asyncio recibe la notificación de salida
+        # del hijo (SIGCHLD/pidfd), así que no hay que revisar los procesos cada segundo
+        returncode = await process.wait()
+        if shutdown_requested:
+            return
+        
+        logger.warning(f"⚠️ {service_name} se ha detenido inesperadamente (código: {returncode})")
+        running_processes.pop(service_name, None)
+        
+        # Un servicio que llevaba tiempo estable vuelve a empezar con el backoff mínimo
+        if loop.time() - started_at >= RESTART_STABLE_AFTER:
+            backoff = RESTART_BACKOFF_INITIAL
+        
+        new_process = None
+        while new_process is None:
+            logger.info(f"🔁 Reiniciando {service_name} en {backoff}s...")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, RESTART_BACKOFF_MAX)
+            new_process = await start_service(service_name, config)
+        
+        process = new_process
+        running_processes[service_name] = process
+        started_at = loop.time()
+
+def signal_handler(main_task: asyncio.Task):
     """Manejador de señales para cierre limpio."""
     global shutdown_requested
+    if shutdown_requested:
+        # Cierre ya en curso: cancelar otra vez interrumpiría shutdown_all_services
+        # y dejaría los servicios huérfanos
+        return
     logger.info("\n🛑 Señal de cierre recibida. Cerrando servicios...")
     shutdown_requested = True
-    shutdown_all_services()
-    sys.exit(0)
+    # La cancelación hace que main_async ejecute su bloque finally
+    main_task.cancel()
 
-def shutdown_all_services():
+async def shutdown_all_services():
     """Cerrar todos los servicios en ejecución."""
+    global shutdown_requested
+    # También cuando el cierre no viene de una señal: las señales posteriores
+    # no deben cancelarlo
+    shutdown_requested = True
     logger.info("🔄 Cerrando todos los servicios...")
     
+    # Dejar de vigilar los servicios antes de cerrarlos
+    for task in watcher_tasks.values():
+        task.cancel()
+    watcher_tasks.clear()
+    
+    # Enviar SIGTERM a todos a la vez para que los periodos de gracia se solapen
+    pending = {}
     for service_name, process in running_processes.items():
-        if process and process.poll() is None:
+        if process and process.returncode is None:
             logger.info(f"🛑 Cerrando {service_name}...")
             try:
                 process.terminate()
-                process.wait(timeout=10)
-                logger.info(f"✅ {service_name} cerrado correctamente")
-            except subprocess.TimeoutExpired:
-                logger.warning(f"⚠️ Forzando cierre de {service_name}...")
-                process.kill()
-                process.wait()
+                pending[asyncio.create_task(process.wait())] = service_name
+            except ProcessLookupError:
+                pass
             except Exception as e:
                 logger.error(f"❌ Error cerrando {service_name}: {e}")
     
+    if pending:
+        # Un único plazo de 10s para todos los servicios
+        done, still_running = await asyncio.wait(pending, timeout=10)
+        for task in done:
+            logger.info(f"✅ {pending[task]} cerrado correctamente")
+        
+        for task in still_running:
+            logger.warning(f"⚠️ Forzando cierre de {pending[task]}...")
+            try:
+                running_processes[pending[task]].kill()
+            except ProcessLookupError:
+                pass
+        await asyncio.gather(*still_running)
+    
     running_processes.clear()
     logger.info("✅ Todos los servicios han sido cerrados")
 
 def open_main_dashboard():
     """Abrir el dashboard principal en el navegador."""
+    import webbrowser
+    
     dashboard_url = "http://localhost:8501"
     logger.info(f"🌐 Abriendo dashboard principal en {dashboard_url}")
     
@@ -222,11 +521,15 @@ def open_main_dashboard():
         logger.error(f"❌ Error abriendo navegador: {e}")
         logger.info(f"📱 Accede manualmente a: {dashboard_url}")
 
-def main():
+async def main_async():
     """Función principal del launcher."""
+    from datetime import datetime
+    
     # Configurar manejadores de señales
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    loop.add_signal_handler(signal.SIGINT, signal_handler, main_task)
+    loop.add_signal_handler(signal.SIGTERM, signal_handler, main_task)
     
     logger.info("="*60)
     logger.info("🚀 AVIATOR SYSTEM LAUNCHER V19.3")
@@ -248,32 +551,19 @@ def main():
         logger.info("🎯 Iniciando servicios del sistema Aviator...")
         logger.info("")
         
-        # Iniciar todos los servicios
-        for service_name, config in SERVICES_CONFIG.items():
-            if shutdown_requested:
-                break
-                
-            process = start_service(service_name, config)
-            if process:
-                running_processes[service_name] = process
-                logger.info(f"📊 {config['description']}: http://localhost:{config['port']}")
-            else:
-                logger.error(f"❌ No se pudo iniciar {config['description']}")
-        
-        logger.info("")
-        logger.info("⏳ Esperando que todos los servicios estén listos...")
-        time.sleep(10)
+        # Iniciar todos los servicios en paralelo; cada uno espera solo a sus dependencias
+        ready_events = {name: asyncio.Event() for name in SERVICES_CONFIG}
+        await asyncio.gather(*(
+            start_with_dependencies(name, config, ready_events)
+            for name, config in SERVICES_CONFIG.items()
+        ))
         
         # Verificar salud de servicios
         logger.info("")
         logger.info("🏥 VERIFICACIÓN DE SALUD DE SERVICIOS")
         logger.info("-" * 50)
         
-        all_healthy = True
-        for service_name, config in SERVICES_CONFIG.items():
-            if service_name in running_processes:
-                if not check_service_health(service_name, config):
-                    all_healthy = False
+        all_healthy = await check_all_services_health()
         
         if all_healthy:
             logger.info("")
@@ -292,34 +582,36 @@ def main():
             logger.info("🎉 SISTEMA AVIATOR INICIADO CORRECTAMENTE")
             logger.info("💡 Presiona Ctrl+C para detener todos los servicios")
             logger.info("="*60)
+            file_log_handler.flush()
             
-            # Mantener el launcher ejecutándose
-            try:
-                while not shutdown_requested:
-                    time.sleep(1)
-                    
-                    # Verificar que los procesos sigan ejecutándose
-                    for service_name, process in list(running_processes.items()):
-                        if process.poll() is not None:
-                            logger.warning(f"⚠️ {service_name} se ha detenido inesperadamente")
-                            del running_processes[service_name]
-                            
-            except KeyboardInterrupt:
-                logger.info("\n🛑 Interrupción de teclado recibida")
+            # Mantener el launcher ejecutándose: sin sondeo periódico, el launcher
+            # queda en reposo hasta que un servicio termine o llegue una señal
+            for service_name, process in running_processes.items():
+                watcher_tasks[service_name] = asyncio.create_task(watch_service(service_name, process))
+            await asyncio.gather(*watcher_tasks.values())
         else:
             logger.error("❌ Algunos servicios no están respondiendo correctamente")
             return 1
             
+    except asyncio.CancelledError:
+        # Cierre solicitado mediante señal (SIGINT/SIGTERM)
+        pass
+    
     except Exception as e:
         logger.error(f"❌ Error crítico en el launcher: {e}")
         return 1
     
     finally:
-        shutdown_all_services()
+        await shutdown_all_services()
         logger.info("👋 Aviator System Launcher finalizado")
+        file_log_handler.flush()
     
     return 0
 
+def main():
+    """Punto de entrada síncrono del launcher."""
+    return asyncio.run(main_async())
+
 if __name__ == "__main__":
     exit_code = main()
     sys.exit(exit_code)
\ No newline at end of file